@@ -1,3 +1,5 @@
+import pygame
+import numpy as np
 from typing import Tuple, Dict
 
 # Screen Dimensions
@@ -11,6 +13,8 @@ CAR_SPEED: int = 3
 PEDESTRIAN_SPEED: float = 1.0 
 SPAWN_RATE: int = 150        
 PEDESTRIAN_SPAWN_RATE: int = 180
+GRID_CELL_SIZE: int = 64         # Spatial hash cell edge (pixels)
+GRID_MIN_ITEMS: int = 24         # Below this many agents the hash scans a flat list
 SAFE_DISTANCE: int = 45     
 EMERGENCY_CHANCE: float = 0.05
 
@@ -18,6 +22,12 @@ EMERGENCY_CHANCE: float = 0.05
 MIN_GREEN_TIME: int = 240   
 YELLOW_TIME: int = 90       
 
+# Traffic Light States (TrafficLight.state)
+NS_GREEN: int = 0
+NS_YELLOW: int = 1
+EW_GREEN: int = 2
+EW_YELLOW: int = 3
+
 # Colors
 RED: Tuple[int, int, int] = (255, 0, 0)
 COLOR_GRASS: Tuple[int, int, int] = (30, 100, 30)
@@ -43,12 +53,20 @@ COLOR_PEDESTRIAN_SHIRT: Tuple[int, int, int] = (50, 50, 200)
 COLOR_PEDESTRIAN_SHOULDERS: Tuple[int, int, int] = (40, 40, 150)
 COLOR_TEXT: Tuple[int, int, int] = (255, 255, 255)
 
+# Signal Head Colors per light state (indexed by NS_GREEN .. EW_YELLOW)
+NS_COLOR_FOR_STATE = (COLOR_GREEN_ON, COLOR_YELLOW_ON, COLOR_RED_ON, COLOR_RED_ON)
+EW_COLOR_FOR_STATE = (COLOR_RED_ON, COLOR_RED_ON, COLOR_GREEN_ON, COLOR_YELLOW_ON)
+
 # Dimensions
 LANE_WIDTH: int = 60
 ROAD_WIDTH: int = LANE_WIDTH * 2 
 INTERSECTION_CENTER: int = WIDTH // 2
 OFFSET = LANE_WIDTH // 2
 
+# Junction Box (shared, never mutated)
+INTERSECTION_RECT = pygame.Rect(INTERSECTION_CENTER - ROAD_WIDTH // 2, INTERSECTION_CENTER - ROAD_WIDTH // 2,
+                                ROAD_WIDTH, ROAD_WIDTH)
+
 # Directions
 NORTH_DIR: Tuple[int, int] = (0, -1)
 SOUTH_DIR: Tuple[int, int] = (0, 1)
@@ -70,6 +88,20 @@ STOP_LINES: Dict[str, int] = {
     "W": INTERSECTION_CENTER - STOP_MARGIN
 }
 
+# Origin Lookup Tables (indexed by ORIGIN_CODE, order N, S, E, W)
+# Tuples serve scalar per-vehicle lookups; the NumPy mirrors serve fleet-wide VehiclePool math.
+ORIGIN_NAMES: Tuple[str, str, str, str] = ("N", "S", "E", "W")
+ORIGIN_CODE: Dict[str, int] = {k: i for i, k in enumerate(ORIGIN_NAMES)}
+STOP_LINES_TUP: Tuple[int, int, int, int] = tuple(STOP_LINES[k] for k in ORIGIN_NAMES)
+LANE_POS_TUP = tuple(LANE_POSITIONS[k] for k in ORIGIN_NAMES)
+ORIGIN_AXIS_TUP: Tuple[int, int, int, int] = (1, 1, 0, 0) # Rect index of the travel axis (0 = x, 1 = y)
+ORIGIN_LEAD_TUP: Tuple[int, int, int, int] = (1, 0, 0, 1) # 1 if the front bumper is the right/bottom rect edge
+ORIGIN_SIGN_TUP: Tuple[int, int, int, int] = (-1, 1, 1, -1) # Distance = sign * (front edge - line)
+
+STOP_LINE_ARR = np.array(STOP_LINES_TUP)
+ORIGIN_LEAD = np.array(ORIGIN_LEAD_TUP)
+ORIGIN_SIGN = np.array(ORIGIN_SIGN_TUP)
+
 # Crosswalks
 # "60 pixels" BEHIND the stop line (closer than previous 140).
 CW_OFFSET = 60 
@@ -87,8 +119,14 @@ ACCELERATION_RATE: float = 0.1        # Speed increase per frame
 DECELERATION_RATE: float = 0.15       # Speed decrease per frame
 SENSOR_WIDTH_PADDING: int = 30        # Side awareness (peripheral vision)
 SAFE_HALT_DISTANCE: float = 40.0      # ~2.0m scaled distance for emergency stop
+SAFE_HALT_DISTANCE_SQ: float = SAFE_HALT_DISTANCE ** 2
 STOPPING_DISTANCE_BUFFER: float = 1.2 # Safety multiplier for stopping distance
 
+# Fleet Vectorization (below this count, scalar per-agent passes beat NumPy's per-call overhead)
+VECTORIZE_MIN_CARS: int = 24
+
+FLOW_SAMPLE_INTERVAL: int = 10         # Frames between lifetime-flow samples (HUD metric)
+
 # Emergency Button
 EMERGENCY_BUTTON_RECT = (WIDTH - 210, HEIGHT - 60, 200, 50)
 
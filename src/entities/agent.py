@@ -1,17 +1,136 @@
 import numpy as np
-import random
-from collections import deque
 from typing import List, Tuple, Any
+from src.jit import njit, NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _matmul_into(a, b, out):
+        """out = a @ b as explicit loops (Numba's np.dot would require SciPy BLAS)."""
+        n, k = a.shape
+        m = b.shape[1]
+        if b.strides[1] == b.itemsize:
+            # Row-major B: accumulate contiguous rows of B (vectorizes over j)
+            out[:] = 0.0
+            for i in range(n):
+                for p in range(k):
+                    a_ip = a[i, p]
+                    for j in range(m):
+                        out[i, j] += a_ip * b[p, j]
+        else:
+            # Transposed B: dot products over contiguous columns
+            for i in range(n):
+                for j in range(m):
+                    acc = 0.0
+                    for p in range(k):
+                        acc += a[i, p] * b[p, j]
+                    out[i, j] = acc
+
+    @njit(cache=True, fastmath=True)
+    def _col_sum_into(x, out):
+        """out[0] = column sums of x (bias gradient), without a temporary."""
+        out[:] = 0.0
+        for i in range(x.shape[0]):
+            for j in range(x.shape[1]):
+                out[0, j] += x[i, j]
+else:
+    def _matmul_into(a, b, out):
+        np.matmul(a, b, out=out)
+
+    def _col_sum_into(x, out):
+        np.sum(x, axis=0, keepdims=True, out=out)
+
+
+@njit(cache=True)
+def _forward_into(x, w1, b1, w2, b2, w3, b3, a1, a2, z3):
+    """GEMM + bias + ReLU chain written into preallocated output buffers."""
+    _matmul_into(x, w1, a1)
+    a1 += b1
+    np.maximum(a1, 0.0, a1)
+    _matmul_into(a1, w2, a2)
+    a2 += b2
+    np.maximum(a2, 0.0, a2)
+    _matmul_into(a2, w3, z3)
+    z3 += b3
+
+
+@njit(cache=True, fastmath=True)
+def _train_step(states, actions, rewards, next_states, dones,
+                w1, b1, w2, b2, w3, b3,
+                a1, a2, z3, delta1, delta2, error, targets,
+                grad_w1, grad_w2, grad_w3, grad_b1, grad_b2, grad_b3,
+                gamma, lr):
+    """
+    One fused DQN update: TD targets, forward pass, backprop and in-place SGD.
+    All per-sample work happens in the caller-owned scratch buffers.
+    """
+    n = states.shape[0]
+
+    # 1. Target Q-Values (row max taken column by column, action_size is tiny)
+    _forward_into(next_states, w1, b1, w2, b2, w3, b3, a1, a2, z3)
+    targets[:] = z3[:, 0]
+    for j in range(1, z3.shape[1]):
+        np.maximum(targets, z3[:, j], targets)
+    targets *= gamma
+    targets *= 1.0 - dones
+    targets += rewards
+
+    # 2. Forward Pass
+    _forward_into(states, w1, b1, w2, b2, w3, b3, a1, a2, z3)
+
+    # 3. Calculate Error (MSE gradient, only the taken action is non-zero)
+    for j in range(z3.shape[1]):
+        error[:, j] = np.where(actions == j, (z3[:, j] - targets) / n, 0.0)
+
+    # 4. Backpropagation
+    _matmul_into(a2.T, error, grad_w3)
+    _matmul_into(error, w3.T, delta2)
+    delta2 *= a2 > 0
+    _matmul_into(a1.T, delta2, grad_w2)
+    _matmul_into(delta2, w2.T, delta1)
+    delta1 *= a1 > 0
+    _matmul_into(states.T, delta1, grad_w1)
+
+    _col_sum_into(error, grad_b3)
+    _col_sum_into(delta2, grad_b2)
+    _col_sum_into(delta1, grad_b1)
+
+    # 5. Update weights (gradients are scaled in their own buffers)
+    grad_b3 *= lr
+    b3 -= grad_b3
+    grad_b2 *= lr
+    b2 -= grad_b2
+    grad_b1 *= lr
+    b1 -= grad_b1
+    grad_w3 *= lr
+    w3 -= grad_w3
+    grad_w2 *= lr
+    w2 -= grad_w2
+    grad_w1 *= lr
+    w1 -= grad_w1
+
 
 class DQNAgent:
     """
     A Deep Q-Network Agent implemented from scratch using NumPy.
     Optimizes traffic light switching by learning from queue states.
     """
-    def __init__(self, state_size: int, action_size: int):
+    def __init__(self, state_size: int, action_size: int, memory_size: int = 5000,
+                 batch_size: int = 32):
         self.state_size = state_size
         self.action_size = action_size
-        self.memory = deque(maxlen=5000)
+        
+        # Replay Buffer (Structure of Arrays, circular)
+        self.memory_size = memory_size
+        self.s_buf = np.empty((memory_size, state_size), dtype=np.float32)
+        self.ns_buf = np.empty((memory_size, state_size), dtype=np.float32)
+        self.a_buf = np.empty(memory_size, dtype=np.int64)
+        self.r_buf = np.empty(memory_size, dtype=np.float32)
+        self.d_buf = np.empty(memory_size, dtype=np.float32)
+        self._pos = 0
+        self._size = 0
+        
+        # Single PRNG stream for exploration and replay sampling
+        self.rng = np.random.default_rng()
         
         # Hyperparameters
         self.gamma = 0.95            
@@ -20,91 +139,112 @@ class DQNAgent:
         self.epsilon_decay = 0.995   
         self.learning_rate = 0.0005
         
-        # Neural Network Weights (Input -> 32 -> 32 -> Output)
-        self.w1 = np.random.randn(state_size, 32).astype(np.float64) * np.sqrt(2./state_size)
-        self.b1 = np.zeros((1, 32), dtype=np.float64)
-        self.w2 = np.random.randn(32, 32).astype(np.float64) * np.sqrt(2./32)
-        self.b2 = np.zeros((1, 32), dtype=np.float64)
-        self.w3 = np.random.randn(32, action_size).astype(np.float64) * 0.1
-        self.b3 = np.zeros((1, action_size), dtype=np.float64)
+        # Neural Network Weights (Input -> 32 -> 32 -> Output), single precision
+        self.w1 = (self.rng.standard_normal((state_size, 32)) * np.sqrt(2./state_size)).astype(np.float32)
+        self.b1 = np.zeros((1, 32), dtype=np.float32)
+        self.w2 = (self.rng.standard_normal((32, 32)) * np.sqrt(2./32)).astype(np.float32)
+        self.b2 = np.zeros((1, 32), dtype=np.float32)
+        self.w3 = (self.rng.standard_normal((32, action_size)) * 0.1).astype(np.float32)
+        self.b3 = np.zeros((1, action_size), dtype=np.float32)
 
-    def _relu(self, x: np.ndarray) -> np.ndarray:
-        return np.maximum(0, x)
+        # Gradient Buffers (reused every training step)
+        self._grad_w1 = np.empty_like(self.w1)
+        self._grad_w2 = np.empty_like(self.w2)
+        self._grad_w3 = np.empty_like(self.w3)
+        self._grad_b1 = np.empty_like(self.b1)
+        self._grad_b2 = np.empty_like(self.b2)
+        self._grad_b3 = np.empty_like(self.b3)
+        
+        # Activation Buffers (sized for one minibatch, grown on demand)
+        self._alloc_scratch(batch_size)
+        
+        # Compile the Numba kernels before the frame loop instead of on the first decision
+        if NUMBA_AVAILABLE:
+            self._warm_up(batch_size)
+
+    def _warm_up(self, batch_size: int) -> None:
+        """Runs each kernel once on zero inputs with the live dtypes; weights are left untouched."""
+        states = np.zeros((batch_size, self.state_size), dtype=np.float32)
+        zeros = np.zeros(batch_size, dtype=np.float32)
+        self._forward(states[:1])
+        _train_step(states, np.zeros(batch_size, dtype=np.int64), zeros, states, zeros,
+                    self.w1.copy(), self.b1.copy(), self.w2.copy(), self.b2.copy(),
+                    self.w3.copy(), self.b3.copy(),
+                    self._a1, self._a2, self._z3, self._delta1, self._delta2, self._error,
+                    self._targets,
+                    self._grad_w1, self._grad_w2, self._grad_w3,
+                    self._grad_b1, self._grad_b2, self._grad_b3,
+                    self.gamma, self.learning_rate)
+
+    def _alloc_scratch(self, rows: int) -> None:
+        """Allocates per-sample forward/backward buffers for up to `rows` samples."""
+        self._a1 = np.empty((rows, 32), dtype=np.float32)
+        self._a2 = np.empty((rows, 32), dtype=np.float32)
+        self._z3 = np.empty((rows, self.action_size), dtype=np.float32)
+        self._delta1 = np.empty((rows, 32), dtype=np.float32)
+        self._delta2 = np.empty((rows, 32), dtype=np.float32)
+        self._error = np.empty((rows, self.action_size), dtype=np.float32)
+        self._targets = np.empty(rows, dtype=np.float32)
 
     def _forward(self, state: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        # Ensure state is 2D (1, state_size)
+        """
+        GEMM + bias + ReLU chain written into the preallocated scratch buffers.
+        The returned arrays are views that the next call overwrites.
+        """
+        # Ensure state is 2D (1, state_size) and matches the weight dtype
         if state.ndim == 1:
             state = state.reshape(1, -1)
-        z1 = np.dot(state, self.w1) + self.b1
-        a1 = self._relu(z1)
-        z2 = np.dot(a1, self.w2) + self.b2
-        a2 = self._relu(z2)
-        z3 = np.dot(a2, self.w3) + self.b3
+        state = np.ascontiguousarray(state, dtype=self.w1.dtype)
+        n = state.shape[0]
+        if n > self._a1.shape[0]:
+            self._alloc_scratch(n)
+        a1, a2, z3 = self._a1[:n], self._a2[:n], self._z3[:n]
+        _forward_into(state, self.w1, self.b1, self.w2, self.b2, self.w3, self.b3, a1, a2, z3)
         return a1, a2, z3
 
     def act(self, state: np.ndarray) -> int:
-        if np.random.rand() <= self.epsilon:
-            return random.randrange(self.action_size)
+        if self.rng.random() <= self.epsilon:
+            return int(self.rng.integers(self.action_size))
         
         try:
             _, _, q_values = self._forward(state)
             return int(np.argmax(q_values[0]))
         except Exception:
-            return random.randrange(self.action_size)
+            return int(self.rng.integers(self.action_size))
 
     def remember(self, state: np.ndarray, action: int, reward: float, next_state: np.ndarray, done: bool):
-        self.memory.append((state.flatten(), action, reward, next_state.flatten(), done))
+        # Direct write into the ring slot; (1, state_size) rows broadcast into place
+        i = self._pos
+        self.s_buf[i] = state
+        self.ns_buf[i] = next_state
+        self.a_buf[i] = action
+        self.r_buf[i] = reward
+        self.d_buf[i] = done
+        self._pos = (i + 1) % self.memory_size
+        self._size = min(self._size + 1, self.memory_size)
 
     def train(self, batch_size: int = 32):
-        if len(self.memory) < batch_size:
+        if self._size < batch_size:
             return
 
-        minibatch = random.sample(self.memory, batch_size)
-        
-        # Vectorized implementation
-        states = np.array([m[0] for m in minibatch])
-        actions = np.array([m[1] for m in minibatch])
-        rewards = np.array([m[2] for m in minibatch])
-        next_states = np.array([m[3] for m in minibatch])
-        dones = np.array([m[4] for m in minibatch])
-
-        # 1. Target Q-Values
-        _, _, next_q_values = self._forward(next_states)
-        max_next_q = np.amax(next_q_values, axis=1)
-        targets = rewards + self.gamma * max_next_q * (1 - dones)
-
-        # 2. Forward Pass
-        z1 = np.dot(states, self.w1) + self.b1
-        a1 = self._relu(z1)
-        z2 = np.dot(a1, self.w2) + self.b2
-        a2 = self._relu(z2)
-        z3 = np.dot(a2, self.w3) + self.b3
-        q_values = z3
-
-        # 3. Calculate Error (Gradient of Loss wrt Output)
-        target_f = q_values.copy()
-        target_f[np.arange(batch_size), actions] = targets
-        error = (q_values - target_f) / batch_size # MSE gradient
-
-        # 4. Backpropagation (Vectorized)
-        grad_w3 = np.dot(a2.T, error)
-        grad_b3 = np.sum(error, axis=0, keepdims=True)
-        
-        delta2 = np.dot(error, self.w3.T) * (a2 > 0)
-        grad_w2 = np.dot(a1.T, delta2)
-        grad_b2 = np.sum(delta2, axis=0, keepdims=True)
-        
-        delta1 = np.dot(delta2, self.w2.T) * (a1 > 0)
-        grad_w1 = np.dot(states.T, delta1)
-        grad_b1 = np.sum(delta1, axis=0, keepdims=True)
-
-        # Update weights
-        self.w3 -= self.learning_rate * grad_w3
-        self.b3 -= self.learning_rate * grad_b3
-        self.w2 -= self.learning_rate * grad_w2
-        self.b2 -= self.learning_rate * grad_b2
-        self.w1 -= self.learning_rate * grad_w1
-        self.b1 -= self.learning_rate * grad_b1
+        # Minibatch gather via fancy indexing over the SoA buffers
+        idx = self.rng.integers(0, self._size, size=batch_size)
+        states = self.s_buf[idx]
+        actions = self.a_buf[idx]
+        rewards = self.r_buf[idx]
+        next_states = self.ns_buf[idx]
+        dones = self.d_buf[idx]
+
+        if batch_size > self._a1.shape[0]:
+            self._alloc_scratch(batch_size)
+        _train_step(states, actions, rewards, next_states, dones,
+                    self.w1, self.b1, self.w2, self.b2, self.w3, self.b3,
+                    self._a1[:batch_size], self._a2[:batch_size], self._z3[:batch_size],
+                    self._delta1[:batch_size], self._delta2[:batch_size], self._error[:batch_size],
+                    self._targets[:batch_size],
+                    self._grad_w1, self._grad_w2, self._grad_w3,
+                    self._grad_b1, self._grad_b2, self._grad_b3,
+                    self.gamma, self.learning_rate)
 
         if self.epsilon > self.epsilon_min:
-            self.epsilon *= self.epsilon_decay
\ No newline at end of file
+            self.epsilon *= self.epsilon_decay
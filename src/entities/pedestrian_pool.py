@@ -0,0 +1,65 @@
+import pygame
+from typing import List, Literal, Optional, Tuple
+from src.config import *
+from src.entities.traffic_light import TrafficLight
+from src.entities.pedestrian import Pedestrian
+
+class PedestrianPool:
+    """
+    Owner of every active pedestrian: spawns them, advances the whole crowd
+    in one loop per tick and drops finished ones. The loop stays scalar: a
+    per-tick array gather and write-back costs more than it saves at every
+    crowd size up to 256.
+    """
+    def __init__(self) -> None:
+        self.peds: List[Pedestrian] = []
+        self._finished: bool = False # Set when a pedestrian turns `done`, so compact() can skip clean ticks
+
+    def spawn(self, start_pos: Tuple[float, float], target_pos: Tuple[float, float],
+              crossing_axis: Literal["NS", "EW"],
+              control_axis: Literal["NS", "EW"]) -> Pedestrian:
+        """Creates a pedestrian and adds it to the crowd (no capacity limit)."""
+        ped = Pedestrian(start_pos, target_pos, crossing_axis, control_axis)
+        self.peds.append(ped)
+        return ped
+
+    def update_all(self, traffic_light: Optional[TrafficLight]) -> None:
+        """Agent logic cycle for the whole crowd: signal waiting, movement and arrival."""
+        if not self.peds:
+            return
+
+        ns_red = ew_red = False
+        if traffic_light:
+            ns_red = traffic_light.get_color_state("NS") == COLOR_RED_ON
+            ew_red = traffic_light.get_color_state("EW") == COLOR_RED_ON
+
+        for p in self.peds:
+            if p.done: continue
+
+            # 1. Damage Handling
+            if p.state == "DOWN":
+                if (pygame.time.get_ticks() - p.down_timer) / 1000.0 > DESPAWN_TIME:
+                    p.done = self._finished = True
+                continue
+
+            # 2. Signal Compliance
+            if not p.walking:
+                if not (ns_red if p.control_axis == "NS" else ew_red): continue
+                p.walking = True
+
+            # 3. Motion Integration
+            px = p.x = p.x + p.dir_x * PEDESTRIAN_SPEED
+            py = p.y = p.y + p.dir_y * PEDESTRIAN_SPEED
+            p.rect.center = (int(px), int(py))
+
+            # Destination Arrival Validation (squared distance, no sqrt)
+            dx, dy = p.target_x - px, p.target_y - py
+            if dx*dx + dy*dy < 100.0:
+                p.done = self._finished = True
+
+    def compact(self) -> None:
+        """Drops finished pedestrians (self.peds is filtered in place)."""
+        if not self._finished:
+            return
+        self._finished = False
+        self.peds[:] = [p for p in self.peds if not p.done]
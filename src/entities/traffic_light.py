@@ -4,7 +4,6 @@ from src.config import *
 from src.graphics import GraphicsRenderer
 
 Axis = Literal["NS", "EW"]
-LightState = Literal["NS_GREEN", "NS_YELLOW", "EW_GREEN", "EW_YELLOW"]
 
 class TrafficLight:
     """
@@ -13,9 +12,18 @@ class TrafficLight:
     """
 
     def __init__(self) -> None:
-        self.state: LightState = "NS_GREEN"
+        self.state: int = NS_GREEN
         self.timer: int = 0
         self.emergency_mode: bool = False
+        
+        # Per-axis colors, refreshed only when the state changes
+        self._ns_color = NS_COLOR_FOR_STATE[self.state]
+        self._ew_color = EW_COLOR_FOR_STATE[self.state]
+
+    def _set_state(self, state: int) -> None:
+        self.state = state
+        self._ns_color = NS_COLOR_FOR_STATE[state]
+        self._ew_color = EW_COLOR_FOR_STATE[state]
 
     def update(self, queues: Dict[Axis, int]) -> None:
         if self.emergency_mode:
@@ -23,47 +31,39 @@ class TrafficLight:
 
         self.timer += 1
         
-        if self.state == "NS_GREEN":
+        if self.state == NS_GREEN:
             if self.timer > MIN_GREEN_TIME:
                 if queues['EW'] > queues['NS']:
-                    self.state = "NS_YELLOW"
+                    self._set_state(NS_YELLOW)
                     self.timer = 0
         
-        elif self.state == "NS_YELLOW":
+        elif self.state == NS_YELLOW:
             if self.timer >= YELLOW_TIME:
-                self.state = "EW_GREEN"
+                self._set_state(EW_GREEN)
                 self.timer = 0
                 
-        elif self.state == "EW_GREEN":
+        elif self.state == EW_GREEN:
             if self.timer > MIN_GREEN_TIME:
                 if queues['NS'] > queues['EW']:
-                    self.state = "EW_YELLOW"
+                    self._set_state(EW_YELLOW)
                     self.timer = 0
                     
-        elif self.state == "EW_YELLOW":
+        elif self.state == EW_YELLOW:
             if self.timer >= YELLOW_TIME:
-                self.state = "NS_GREEN"
+                self._set_state(NS_GREEN)
                 self.timer = 0
 
     def get_color_state(self, axis: Axis) -> Tuple[int, int, int]:
         """Returns the RGB color constant for the given axis based on state."""
-        if axis == "NS":
-            if self.state == "NS_GREEN": return COLOR_GREEN_ON
-            if self.state == "NS_YELLOW": return COLOR_YELLOW_ON
-            return COLOR_RED_ON
-        elif axis == "EW":
-            if self.state == "EW_GREEN": return COLOR_GREEN_ON
-            if self.state == "EW_YELLOW": return COLOR_YELLOW_ON
-            return COLOR_RED_ON
-        return COLOR_RED_ON
+        return self._ns_color if axis == "NS" else self._ew_color
 
     def set_emergency_mode(self, active: bool, direction: Optional[str] = None) -> None:
         self.emergency_mode = active
         if active and direction:
             if direction in ["N", "S"]:
-                self.state = "NS_GREEN"
+                self._set_state(NS_GREEN)
             else:
-                self.state = "EW_GREEN"
+                self._set_state(EW_GREEN)
             self.timer = 0 
 
     def apply_action(self, action: int) -> None:
@@ -76,11 +76,11 @@ class TrafficLight:
             return
 
         if action == 1:
-            if self.state == "NS_GREEN":
-                self.state = "NS_YELLOW"
+            if self.state == NS_GREEN:
+                self._set_state(NS_YELLOW)
                 self.timer = 0
-            elif self.state == "EW_GREEN":
-                self.state = "EW_YELLOW"
+            elif self.state == EW_GREEN:
+                self._set_state(EW_YELLOW)
                 self.timer = 0
 
     def draw(self, renderer: GraphicsRenderer) -> None:
@@ -0,0 +1,225 @@
+import numpy as np
+import pygame
+from typing import List, Tuple
+from src.config import *
+from src.jit import njit, NUMBA_AVAILABLE
+from src.entities.vehicle import Vehicle
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _integrate(xs, ys, dir_x, dir_y, speeds, targets, stopped, accel, decel):
+        """Speed interpolation + position integration for the whole fleet, in place."""
+        for i in range(xs.shape[0]):
+            v, t = speeds[i], targets[i]
+            if v < t:
+                v = min(t, v + accel)
+            elif v > t:
+                v = max(t, v - decel)
+
+            if v < 0.05:
+                speeds[i] = 0.0
+                stopped[i] = True
+            else:
+                speeds[i] = v
+                stopped[i] = False
+                xs[i] += dir_x[i] * v
+                ys[i] += dir_y[i] * v
+else:
+    def _integrate(xs, ys, dir_x, dir_y, speeds, targets, stopped, accel, decel):
+        speeds[:] = np.where(speeds < targets, np.minimum(targets, speeds + accel),
+                             np.where(speeds > targets, np.maximum(targets, speeds - decel), speeds))
+        np.less(speeds, 0.05, out=stopped)
+        speeds[stopped] = 0.0
+        # Stopped cars have zero speed, so their positions are left unchanged
+        xs += dir_x * speeds
+        ys += dir_y * speeds
+
+class VehiclePool:
+    """
+    Owner of every active vehicle. Each Vehicle keeps its own kinematic state
+    and, below VECTORIZE_MIN_CARS, answers perception queries with per-car
+    scans (NumPy's per-call overhead costs more than the loops at the 3-21
+    cars the sim usually runs). For larger fleets `refresh` gathers positions
+    into Structure-of-Arrays tables once per tick; per-car constants live in
+    persistent slots written on spawn and re-packed on compaction.
+    """
+    _FIELDS: Tuple[str, ...] = ("dir_x", "dir_y", "widths", "heights", "origin_idx", "is_ns")
+
+    def __init__(self, capacity: int = 32) -> None:
+        self.cars: List[Vehicle] = []
+        self.lanes: Tuple[List[Vehicle], ...] = ([], [], [], []) # Cars per origin, spawn order
+        self.n: int = 0
+        self.capacity = capacity
+
+        # Per-car Constants (slot i belongs to cars[i])
+        self.dir_x = np.zeros(capacity)
+        self.dir_y = np.zeros(capacity)
+        self.widths = np.zeros(capacity, dtype=np.int64)
+        self.heights = np.zeros(capacity, dtype=np.int64)
+        self.origin_idx = np.zeros(capacity, dtype=np.int64)
+        self.is_ns = np.zeros(capacity, dtype=bool)
+
+        # Fleet Tables (rebuilt by `refresh` only while vectorized)
+        self.vectorized: bool = False
+        self.xs = np.zeros(0)
+        self.ys = np.zeros(0)
+        self.dist_to_sl: List[float] = []
+        self.lead_gap: List[float] = []
+
+        # Compile the kernel now rather than stalling the first large-fleet frame
+        if NUMBA_AVAILABLE:
+            _integrate(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1),
+                       np.zeros(1), np.zeros(1, dtype=bool), ACCELERATION_RATE, DECELERATION_RATE)
+
+    def spawn(self, start_pos: Tuple[int, int], direction: Tuple[int, int],
+              origin: str, is_emergency: bool = False) -> Vehicle:
+        """Creates a vehicle in the next free slot (growing the arrays when full)."""
+        if self.n == self.capacity:
+            self._grow()
+
+        car = Vehicle(start_pos, direction, origin, is_emergency)
+        i = car.pool_idx = self.n
+        self.dir_x[i], self.dir_y[i] = direction
+        self.widths[i], self.heights[i] = car.width, car.height
+        self.origin_idx[i] = car.origin_idx
+        self.is_ns[i] = ORIGIN_AXIS_TUP[car.origin_idx] == 1
+
+        self.cars.append(car)
+        self.lanes[car.origin_idx].append(car)
+        self.n += 1
+        return car
+
+    def _grow(self) -> None:
+        self.capacity *= 2
+        for name in self._FIELDS:
+            arr = getattr(self, name)
+            grown = np.zeros(self.capacity, dtype=arr.dtype)
+            grown[:self.n] = arr[:self.n]
+            setattr(self, name, grown)
+
+    def compact(self) -> int:
+        """Drops vehicles more than 100px off the map and re-packs the slots. Returns the count removed."""
+        keep = [-100 <= c.x <= WIDTH + 100 and -100 <= c.y <= HEIGHT + 100 for c in self.cars]
+        n, m = self.n, sum(keep)
+        if m == n:
+            return 0
+
+        mask = np.array(keep)
+        for name in self._FIELDS:
+            arr = getattr(self, name)
+            arr[:m] = arr[:n][mask]
+
+        # One pass: survivors slide down to their new slot and are re-indexed
+        cars, w = self.cars, 0
+        for c, k in zip(cars, keep):
+            if k:
+                cars[w] = c
+                c.pool_idx = w
+                w += 1
+            else:
+                c.pool_idx = -1
+        del cars[w:]
+        for lane in self.lanes:
+            lane[:] = [c for c in lane if c.pool_idx >= 0]
+        self.n = m
+        return n - m
+
+    def refresh(self) -> None:
+        """Rebuilds the fleet tables for the current positions once the fleet is large enough."""
+        self.vectorized = self.n >= VECTORIZE_MIN_CARS
+        if not self.vectorized:
+            return
+
+        n, cars = self.n, self.cars
+        self.xs = np.fromiter((c.x for c in cars), dtype=np.float64, count=n)
+        self.ys = np.fromiter((c.y for c in cars), dtype=np.float64, count=n)
+
+        # int() truncation, matching each car's pygame.Rect
+        lefts, tops = np.trunc(self.xs), np.trunc(self.ys)
+        widths, heights = self.widths[:n], self.heights[:n]
+        origin_idx = self.origin_idx[:n]
+
+        # Table-driven bumper positions: no per-origin branching
+        is_ns = self.is_ns[:n]
+        pos = np.where(is_ns, tops, lefts)
+        ext = np.where(is_ns, heights, widths)
+        lead = ORIGIN_LEAD[origin_idx]
+        fronts = pos + ext * lead
+        rears = pos + ext * (1 - lead)
+
+        sign = ORIGIN_SIGN[origin_idx]
+        # Python lists: every car reads back one entry of each table
+        self.dist_to_sl = (sign * (fronts - STOP_LINE_ARR[origin_idx])).tolist()
+
+        # gap[i, j]: free space between car i's front and car j's rear along i's lane.
+        # Only same-lane cars ahead count as leaders (a car's gap to itself is negative).
+        gap = sign[:, None] * np.subtract.outer(fronts, rears)
+        gap[(gap <= 0) | (origin_idx[:, None] != origin_idx)] = np.inf
+        self.lead_gap = gap.min(axis=1).tolist()
+
+    def stop_line_distance(self, car: Vehicle) -> float:
+        """Signed distance from `car`'s front bumper to its stop line (positive before it)."""
+        if self.vectorized:
+            return self.dist_to_sl[car.pool_idx]
+        return car._get_dist_to_stop_line()
+
+    def leader_gap(self, car: Vehicle) -> float:
+        """Free space to the nearest same-lane car ahead of `car` (inf when none)."""
+        if self.vectorized:
+            return self.lead_gap[car.pool_idx]
+
+        o = car.origin_idx
+        ax, lead, sign = ORIGIN_AXIS_TUP[o], ORIGIN_LEAD_TUP[o], ORIGIN_SIGN_TUP[o]
+        r = car.rect
+        front, best = r[ax] + r[ax + 2] * lead, np.inf
+        # A car's own front-minus-rear is always negative along its lane, so it never leads itself
+        for other in self.lanes[o]:
+            ro = other.rect
+            gap = sign * (front - ro[ax] - ro[ax + 2] * (1 - lead))
+            if 0 < gap < best: best = gap
+        return float(best)
+
+    def overlapping(self, rect: pygame.Rect) -> List[Vehicle]:
+        """
+        Vehicles whose rect overlaps `rect` (colliderect semantics). Always a
+        scan: a masked box test costs ~5us per call even at 40 cars.
+        """
+        return [c for c in self.cars if rect.colliderect(c.rect)]
+
+    def integrate(self) -> None:
+        """
+        Physical actuation for the whole fleet: a per-car loop for small
+        fleets, one kernel pass plus a write-back (rects only for movers)
+        once the tables are in use.
+        """
+        if not self.vectorized:
+            for c in self.cars:
+                v, t = c.current_speed, c.target_speed
+                if v < t:
+                    v = min(t, v + ACCELERATION_RATE)
+                elif v > t:
+                    v = max(t, v - DECELERATION_RATE)
+
+                if v < 0.05:
+                    c.current_speed, c.stopped = 0.0, True
+                else:
+                    c.current_speed, c.stopped = v, False
+                    c.x += c.direction[0] * v
+                    c.y += c.direction[1] * v
+                    c.rect.topleft = (int(c.x), int(c.y))
+            return
+
+        cars, n = self.cars, self.n
+        xs, ys = self.xs, self.ys
+        speeds = np.fromiter((c.current_speed for c in cars), dtype=np.float64, count=n)
+        targets = np.fromiter((c.target_speed for c in cars), dtype=np.float64, count=n)
+        stopped = np.zeros(n, dtype=bool)
+        _integrate(xs, ys, self.dir_x[:n], self.dir_y[:n], speeds, targets, stopped,
+                   ACCELERATION_RATE, DECELERATION_RATE)
+
+        for c, x, y, v, halt in zip(cars, xs.tolist(), ys.tolist(),
+                                    speeds.tolist(), stopped.tolist()):
+            c.current_speed, c.stopped = v, halt
+            if not halt:
+                c.x, c.y = x, y
+                c.rect.topleft = (int(x), int(y))
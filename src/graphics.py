@@ -7,87 +7,103 @@ class GraphicsRenderer:
         self.font = pygame.font.SysFont("Segoe UI", 20, bold=True)
         self.large_font = pygame.font.SysFont("Segoe UI", 36, bold=True)
 
+        # Static Scene Cache (opaque, display pixel format for the fast blit path)
+        self._build_crosswalk_strips()
+        self._bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self._build_background(self._bg)
+
     def draw_environment(self):
         """Draws the intersection with asphalt, curbs, crosswalks, and markings."""
-        self.surface.fill(COLOR_GRASS)
+        self.surface.blit(self._bg, (0, 0))
+
+    def _build_crosswalk_strips(self):
+        """Pre-renders one horizontal and one vertical zebra strip (transparent gaps)."""
+        stripe_w = 6
+        self._cw_h = pygame.Surface((ROAD_WIDTH, CW_WIDTH), pygame.SRCALPHA)
+        self._cw_v = pygame.Surface((CW_WIDTH, ROAD_WIDTH), pygame.SRCALPHA)
+        for i in range(0, ROAD_WIDTH, 15):
+            pygame.draw.rect(self._cw_h, COLOR_MARKING, (i, 0, stripe_w, CW_WIDTH))
+            pygame.draw.rect(self._cw_v, COLOR_MARKING, (0, i, CW_WIDTH, stripe_w))
+
+    def _build_background(self, surface: pygame.Surface):
+        """Rasterizes the static intersection once; draw_environment only blits it."""
+        surface.fill(COLOR_GRASS)
         
         cx = INTERSECTION_CENTER
         cy = INTERSECTION_CENTER
         rw = ROAD_WIDTH // 2
+        sn, ss, se, sw = STOP_LINES["N"], STOP_LINES["S"], STOP_LINES["E"], STOP_LINES["W"]
+        cwo, cww = CW_OFFSET, CW_WIDTH
         
         # 1. Draw Roads (Asphalt)
-        pygame.draw.rect(self.surface, COLOR_ROAD, (cx - rw, 0, ROAD_WIDTH, HEIGHT))
-        pygame.draw.rect(self.surface, COLOR_ROAD, (0, cy - rw, WIDTH, ROAD_WIDTH))
+        pygame.draw.rect(surface, COLOR_ROAD, (cx - rw, 0, ROAD_WIDTH, HEIGHT))
+        pygame.draw.rect(surface, COLOR_ROAD, (0, cy - rw, WIDTH, ROAD_WIDTH))
         
         # 2. Draw Sidewalks (Connecting Grass to Road)
         # We draw grey areas where pedestrians walk/wait
         # Corners logic:
         # TL Corner Sidewalk
         sw_width = 30
-        pygame.draw.rect(self.surface, COLOR_SIDEWALK, (cx - rw - sw_width, 0, sw_width, cy - rw)) # Vertical strip
-        pygame.draw.rect(self.surface, COLOR_SIDEWALK, (0, cy - rw - sw_width, cx - rw, sw_width)) # Horizontal strip
+        pygame.draw.rect(surface, COLOR_SIDEWALK, (cx - rw - sw_width, 0, sw_width, cy - rw)) # Vertical strip
+        pygame.draw.rect(surface, COLOR_SIDEWALK, (0, cy - rw - sw_width, cx - rw, sw_width)) # Horizontal strip
         
         # Draw Borders (Curbs)
         border_col = (20, 20, 20)
         # Vertical
-        pygame.draw.line(self.surface, border_col, (cx - rw, 0), (cx - rw, HEIGHT), 2)
-        pygame.draw.line(self.surface, border_col, (cx + rw, 0), (cx + rw, HEIGHT), 2)
+        pygame.draw.line(surface, border_col, (cx - rw, 0), (cx - rw, HEIGHT), 2)
+        pygame.draw.line(surface, border_col, (cx + rw, 0), (cx + rw, HEIGHT), 2)
         # Horizontal
-        pygame.draw.line(self.surface, border_col, (0, cy - rw), (WIDTH, cy - rw), 2)
-        pygame.draw.line(self.surface, border_col, (0, cy + rw), (WIDTH, cy + rw), 2)
+        pygame.draw.line(surface, border_col, (0, cy - rw), (WIDTH, cy - rw), 2)
+        pygame.draw.line(surface, border_col, (0, cy + rw), (WIDTH, cy + rw), 2)
 
         # 3. Draw Crosswalks (Zebra Stripes) - Shifted BEHIND stop lines
-        stripe_w = 6
         cw_len = ROAD_WIDTH + 20 
         
         # North Crosswalk
-        cw_n_y = STOP_LINES["N"] - CW_OFFSET
-        pygame.draw.rect(self.surface, (80, 80, 80), (cx - rw - 10, cw_n_y, cw_len, CW_WIDTH)) 
-        for i in range(cx - rw, cx + rw, 15):
-             pygame.draw.rect(self.surface, COLOR_MARKING, (i, cw_n_y, stripe_w, CW_WIDTH))
+        cw_n_y = sn - cwo
+        pygame.draw.rect(surface, (80, 80, 80), (cx - rw - 10, cw_n_y, cw_len, cww)) 
+        surface.blit(self._cw_h, (cx - rw, cw_n_y))
 
         # South Crosswalk
-        cw_s_y = STOP_LINES["S"] + CW_OFFSET - CW_WIDTH
-        pygame.draw.rect(self.surface, (80, 80, 80), (cx - rw - 10, cw_s_y, cw_len, CW_WIDTH))
-        for i in range(cx - rw, cx + rw, 15):
-             pygame.draw.rect(self.surface, COLOR_MARKING, (i, cw_s_y, stripe_w, CW_WIDTH))
+        cw_s_y = ss + cwo - cww
+        pygame.draw.rect(surface, (80, 80, 80), (cx - rw - 10, cw_s_y, cw_len, cww))
+        surface.blit(self._cw_h, (cx - rw, cw_s_y))
 
         # West Crosswalk
-        cw_w_x = STOP_LINES["W"] - CW_OFFSET
-        pygame.draw.rect(self.surface, (80, 80, 80), (cw_w_x, cy - rw - 10, CW_WIDTH, cw_len))
-        for i in range(cy - rw, cy + rw, 15):
-             pygame.draw.rect(self.surface, COLOR_MARKING, (cw_w_x, i, CW_WIDTH, stripe_w))
+        cw_w_x = sw - cwo
+        pygame.draw.rect(surface, (80, 80, 80), (cw_w_x, cy - rw - 10, cww, cw_len))
+        surface.blit(self._cw_v, (cw_w_x, cy - rw))
 
         # East Crosswalk
-        cw_e_x = STOP_LINES["E"] + CW_OFFSET - CW_WIDTH
-        pygame.draw.rect(self.surface, (80, 80, 80), (cw_e_x, cy - rw - 10, CW_WIDTH, cw_len))
-        for i in range(cy - rw, cy + rw, 15):
-             pygame.draw.rect(self.surface, COLOR_MARKING, (cw_e_x, i, CW_WIDTH, stripe_w))
+        cw_e_x = se + cwo - cww
+        pygame.draw.rect(surface, (80, 80, 80), (cw_e_x, cy - rw - 10, cww, cw_len))
+        surface.blit(self._cw_v, (cw_e_x, cy - rw))
 
-        # 4. Draw Center Lines (Double Yellow) - Interrupted
+        # 4. Draw Center Lines (Double Yellow) - Interrupted, baked once with the background
+        center_col = (200, 150, 0)
         # N
-        pygame.draw.line(self.surface, (200, 150, 0), (cx - 2, 0), (cx - 2, cw_n_y), 2)
-        pygame.draw.line(self.surface, (200, 150, 0), (cx + 2, 0), (cx + 2, cw_n_y), 2)
+        pygame.draw.line(surface, center_col, (cx - 2, 0), (cx - 2, cw_n_y), 2)
+        pygame.draw.line(surface, center_col, (cx + 2, 0), (cx + 2, cw_n_y), 2)
         # S
-        pygame.draw.line(self.surface, (200, 150, 0), (cx - 2, cw_s_y + CW_WIDTH), (cx - 2, HEIGHT), 2)
-        pygame.draw.line(self.surface, (200, 150, 0), (cx + 2, cw_s_y + CW_WIDTH), (cx + 2, HEIGHT), 2)
+        pygame.draw.line(surface, center_col, (cx - 2, cw_s_y + cww), (cx - 2, HEIGHT), 2)
+        pygame.draw.line(surface, center_col, (cx + 2, cw_s_y + cww), (cx + 2, HEIGHT), 2)
         # W
-        pygame.draw.line(self.surface, (200, 150, 0), (0, cy - 2), (cw_w_x, cy - 2), 2)
-        pygame.draw.line(self.surface, (200, 150, 0), (0, cy + 2), (cw_w_x, cy + 2), 2)
+        pygame.draw.line(surface, center_col, (0, cy - 2), (cw_w_x, cy - 2), 2)
+        pygame.draw.line(surface, center_col, (0, cy + 2), (cw_w_x, cy + 2), 2)
         # E
-        pygame.draw.line(self.surface, (200, 150, 0), (cw_e_x + CW_WIDTH, cy - 2), (WIDTH, cy - 2), 2)
-        pygame.draw.line(self.surface, (200, 150, 0), (cw_e_x + CW_WIDTH, cy + 2), (WIDTH, cy + 2), 2)
+        pygame.draw.line(surface, center_col, (cw_e_x + cww, cy - 2), (WIDTH, cy - 2), 2)
+        pygame.draw.line(surface, center_col, (cw_e_x + cww, cy + 2), (WIDTH, cy + 2), 2)
 
         # 5. Draw Stop Lines (Thick White)
         # Drawn at the STOP_LINES coordinates (between intersection and crosswalk)
         # N
-        pygame.draw.line(self.surface, COLOR_STOP_LINE, (cx - rw, STOP_LINES["N"]), (cx, STOP_LINES["N"]), 6)
+        pygame.draw.line(surface, COLOR_STOP_LINE, (cx - rw, sn), (cx, sn), 6)
         # S
-        pygame.draw.line(self.surface, COLOR_STOP_LINE, (cx, STOP_LINES["S"]), (cx + rw, STOP_LINES["S"]), 6)
+        pygame.draw.line(surface, COLOR_STOP_LINE, (cx, ss), (cx + rw, ss), 6)
         # E
-        pygame.draw.line(self.surface, COLOR_STOP_LINE, (STOP_LINES["E"], cy - rw), (STOP_LINES["E"], cy), 6)
+        pygame.draw.line(surface, COLOR_STOP_LINE, (se, cy - rw), (se, cy), 6)
         # W
-        pygame.draw.line(self.surface, COLOR_STOP_LINE, (STOP_LINES["W"], cy), (STOP_LINES["W"], cy + rw), 6)
+        pygame.draw.line(surface, COLOR_STOP_LINE, (sw, cy), (sw, cy + rw), 6)
         
     def draw_traffic_light(self, x: int, y: int, color: Tuple[int, int, int], horizontal: bool = False):
         w, h = (60, 20) if horizontal else (20, 60)
@@ -0,0 +1,21 @@
+"""
+Optional Numba acceleration.
+Hot numerical kernels are decorated with `njit`; when Numba is not installed
+the decorator is a no-op and the kernels run as plain NumPy code.
+"""
+from typing import Any, Callable
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE: bool = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        # Supports both @njit and @njit(cache=True, ...)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable) -> Callable:
+            return func
+        return decorator
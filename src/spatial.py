@@ -0,0 +1,59 @@
+import numpy as np
+import pygame
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+from src.config import GRID_CELL_SIZE, GRID_MIN_ITEMS
+
+class SpatialHash:
+    """
+    Uniform grid that buckets agents by the cell containing their center.
+    Rebuilt once per tick; queries only visit the cells a rect overlaps.
+    Below `min_items` agents the buckets cost more than they save, so the
+    hash keeps a flat list and queries test every center directly.
+    """
+    def __init__(self, cell_size: int = GRID_CELL_SIZE, min_items: int = GRID_MIN_ITEMS) -> None:
+        self.cell_size = cell_size
+        self.min_items = min_items
+        self.buckets: Dict[Tuple[int, int], List[Any]] = defaultdict(list)
+        self.flat: bool = True
+        self._items: Sequence[Any] = ()
+        self._xs: List[float] = []
+        self._ys: List[float] = []
+
+    def rebuild(self, items: Sequence[Any], xs: List[float], ys: List[float]) -> None:
+        """Re-buckets `items` using the parallel center coordinate lists."""
+        self.flat = len(items) < self.min_items
+        if self.flat:
+            self._items, self._xs, self._ys = items, xs, ys
+            return
+
+        self.buckets.clear()
+        cs = self.cell_size
+        cells_x = (np.asarray(xs) // cs).astype(int).tolist()
+        cells_y = (np.asarray(ys) // cs).astype(int).tolist()
+        for item, cx, cy in zip(items, cells_x, cells_y):
+            self.buckets[(cx, cy)].append(item)
+
+    def query_rect(self, rect: pygame.Rect, margin: int = 0) -> Iterator[Any]:
+        """
+        Yields every item whose center lies in a cell overlapped by `rect`
+        grown by `margin` (the largest half-extent of the queried agents).
+        In flat mode the test is exact: the center must lie in the grown rect.
+        """
+        if self.flat:
+            x0, x1 = rect.left - margin, rect.right + margin
+            y0, y1 = rect.top - margin, rect.bottom + margin
+            for item, x, y in zip(self._items, self._xs, self._ys):
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    yield item
+            return
+
+        cs = self.cell_size
+        x0, x1 = (rect.left - margin) // cs, (rect.right + margin) // cs
+        y0, y1 = (rect.top - margin) // cs, (rect.bottom + margin) // cs
+        buckets = self.buckets
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket:
+                    yield from bucket
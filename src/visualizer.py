@@ -1,5 +1,6 @@
 import pygame
 import math
+import numpy as np
 import time
 from collections import deque
 from typing import List, Tuple, Dict, Any, Optional
@@ -15,6 +16,39 @@ DEEP_SPACE = (10, 10, 20)
 ASPHALT_NIGHT = (25, 25, 35)
 SIDEWALK_GLOW = (40, 40, 60)
 
+# Sprite Geometry
+GLOW_PAD = 4            # Glow margin baked around every entity sprite
+PED_BODY_RADIUS = 8     # Matches Pedestrian.radius
+TEXT_CACHE_SIZE = 512   # Rendered label surfaces kept before the oldest is evicted
+NUMBER_GLYPHS = "0123456789.:%u- "  # Characters live HUD values are composed from
+FULL_FLIP_FRACTION = 0.5  # Merged dirty area (share of the screen) above which a full flip is cheaper
+
+# Perception Rays: (angle offset in degrees, length multiplier)
+CAR_RAYS = ((-15, 0.8), (0, 1.0), (15, 0.8))
+DEBUG_KEY = (0, 0, 0)   # Colorkey of the debug overlay layer (no overlay is pure black)
+FOV_STEP = 15           # Pedestrian FOV sprites are pre-rendered every FOV_STEP degrees
+
+# Unit ray directions per heading (cars only travel along the 4 axes): (dx, dy, length multiplier)
+_RAY_OFFSETS = {
+    d: tuple((math.cos(math.atan2(d[1], d[0]) + math.radians(angle)),
+              math.sin(math.atan2(d[1], d[0]) + math.radians(angle)), l_mult)
+             for angle, l_mult in CAR_RAYS)
+    for d in (NORTH_DIR, SOUTH_DIR, EAST_DIR, WEST_DIR)
+}
+
+# Traffic Light Placement: (x, y, axis, horizontal_flag)
+_CX, _RW = INTERSECTION_CENTER, ROAD_WIDTH // 2
+_TL_CONFIGS = (
+    (_CX - _RW - 25, _CX - _RW - 75, "NS", False), # North-West corner (facing North)
+    (_CX + _RW + 5, _CX + _RW + 15, "NS", False),  # South-East corner (facing South)
+    (_CX - _RW - 75, _CX + _RW + 5, "EW", True),   # South-West corner (facing West)
+    (_CX + _RW + 15, _CX - _RW - 25, "EW", True)   # North-East corner (facing East)
+)
+# Bulbs (Red, Yellow, Green) as (lit color, off color)
+_TL_BULBS = ((COLOR_RED_ON, (80, 0, 0)), (COLOR_YELLOW_ON, (80, 60, 0)), (COLOR_GREEN_ON, (0, 80, 0)))
+# Housing rects grown by the bulb glow overhang (what each light repaints per frame)
+_TL_DIRTY = tuple(pygame.Rect(x, y, *((60, 20) if h else (20, 60))).inflate(12, 12) for x, y, _, h in _TL_CONFIGS)
+
 class VisualizationManager:
     """
     Principal Visualization Engine for Autonomous Traffic Simulation.
@@ -34,8 +68,79 @@ class VisualizationManager:
         self.collision_count = 0
         self.avoided_count = 0
         
-        # Inspector State
+        # Inspector State (cars bucketed per frame; pedestrians use the simulation's grid)
         self.hovered_agent = None
+        self._mouse_rect = pygame.Rect(0, 0, 1, 1)
+        
+        # Debug Overlay Layer (rays, FOV arcs, vectors, paths): redrawn every `debug_every` frames
+        self.debug_every = 2
+        self._debug_layer = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self._debug_layer.set_colorkey(DEBUG_KEY)
+        self._debug_layer.fill(DEBUG_KEY)
+        self._overlay_rects: List[pygame.Rect] = []
+        self._overlay_blits: List[Tuple[pygame.Surface, pygame.Rect, pygame.Rect]] = [] # Layer copied through its footprint
+        
+        # Dirty-Rect Tracking (what changed this frame + what must be erased from the last)
+        self.dirty_rects: List[pygame.Rect] = [screen.get_rect()]
+        self.full_frame: bool = True # Present with display.flip() instead of the rect list
+        self._dirty: List[pygame.Rect] = []
+        self._prev_dirty: List[pygame.Rect] = []
+        self._full_redraw = True
+        self._flip_area = FULL_FLIP_FRACTION * screen.get_width() * screen.get_height()
+        
+        # Translucent Surface Caches (built on first use, never per frame)
+        self._glow_cache: Dict[Tuple[int, int, Tuple[int, int, int]], pygame.Surface] = {}
+        self._panel_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._text_cache: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._glyph_cache: Dict[Tuple[int, Tuple[int, int, int]], Dict[str, pygame.Surface]] = {}
+        self._popup_bg = pygame.Surface((200, 100), pygame.SRCALPHA)
+        self._popup_bg.fill((10, 10, 30, 230))
+        pygame.draw.rect(self._popup_bg, NEON_CYAN, self._popup_bg.get_rect(), 1)
+        
+        # Static Scene Cache (opaque, display pixel format for the fast blit path)
+        self._build_crosswalk_strips()
+        self._bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self._build_background(self._bg)
+        
+        # Entity Sprites (glow baked in, blitted in one batch per layer)
+        self._build_entity_sprites()
+        self._build_button_glow()
+        self._build_bulb_sprites()
+        self._build_fov_sprites()
+        self._build_overlay_sprites()
+
+    def _text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Antialiased label, rasterized once per (font, string, color)."""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))] # Oldest entry first
+            surf = self._text_cache[key] = font.render(text, True, color)
+        return surf
+
+    def _glyphs(self, font: pygame.font.Font, color: Tuple[int, int, int]) -> Dict[str, pygame.Surface]:
+        """Per-character sprites of NUMBER_GLYPHS, rasterized once per (font, color)."""
+        key = (id(font), color)
+        atlas = self._glyph_cache.get(key)
+        if atlas is None:
+            atlas = self._glyph_cache[key] = {ch: font.render(ch, True, color) for ch in NUMBER_GLYPHS}
+        return atlas
+
+    def _compose_number(self, font: pygame.font.Font, text: str, pos: Tuple[int, int],
+                        color: Tuple[int, int, int], seq: List[Tuple[pygame.Surface, Tuple[int, int]]]) -> int:
+        """Appends a changing value's glyph sprites to a blit sequence (no font rasterizing); returns the end x."""
+        atlas = self._glyphs(font, color)
+        x, y = pos
+        for ch in text:
+            glyph = atlas[ch]
+            seq.append((glyph, (x, y)))
+            x += glyph.get_width()
+        return x
+
+    def invalidate(self) -> None:
+        """Forces the next frame to present the whole screen (window exposed or restored)."""
+        self._full_redraw = True
 
     def add_event(self, message: str):
         timestamp = time.strftime("%M:%S", time.gmtime(time.time() - self.start_time))
@@ -43,24 +148,91 @@ class VisualizationManager:
 
     def render(self, sim):
         """Main rendering pipeline."""
-        self.screen.fill(DEEP_SPACE)
-        self._draw_infrastructure()
+        self.screen.blit(self._bg, (0, 0))
+        dirty = self._dirty = []
+        
+        # Agent Centers (SoA, shared by the perception overlays' proximity tests)
+        self._ped_xy = np.array([(p.x, p.y) for p in sim.pedestrians], dtype=float).reshape(-1, 2)
+        self._car_xy = np.array([c.rect.center for c in sim.cars], dtype=float).reshape(-1, 2)
         
-        # Agent Layers
+        # Debug Layer refresh (skipped frames reuse the last overlay as-is)
+        draw_debug = sim.frame_count % self.debug_every == 0
+        if draw_debug:
+            self._debug_layer.fill(DEBUG_KEY)
+        
+        # Agent Layers (overlays into the debug layer, bodies in one fblits call per layer)
+        car_blits = []
+        overlay_blits = [] # Car path dots + heading vectors, batched into one fblits per refresh
         for car in sim.cars:
-            self._draw_car_perception(car, sim.pedestrians, sim.traffic_light)
-            self._draw_agent_vectors(car)
-            self._draw_entity_core(car, NEON_CYAN if not car.is_emergency else NEON_RED)
+            if draw_debug:
+                self._draw_car_perception(car, sim.traffic_light)
+                self._queue_car_overlays(car, overlay_blits)
+            sprite = self._get_car_sprite(car.width, car.height, NEON_RED if car.is_emergency else NEON_CYAN)
+            car_blits.append((sprite, (car.rect.x - GLOW_PAD, car.rect.y - GLOW_PAD)))
+            # Overlay reach: rays (+-15 deg fan), markers and the 125px predicted path,
+            # all ahead of the center, plus the glowing body
+            reach = int(max(125, car.current_speed * 40)) + 8
+            half = reach // 3
+            (cx, cy), (dx, dy) = car.rect.center, car.direction
+            ahead = pygame.Rect(cx - half if dx == 0 else (cx if dx > 0 else cx - reach),
+                                cy - half if dy == 0 else (cy if dy > 0 else cy - reach),
+                                reach if dx else half * 2, reach if dy else half * 2)
+            dirty.append(ahead.union(car.rect.inflate(GLOW_PAD * 2, GLOW_PAD * 2)))
 
+        ped_blits = []
+        r = PED_BODY_RADIUS + GLOW_PAD
         for p in sim.pedestrians:
-            self._draw_pedestrian_perception(p, sim.cars)
-            self._draw_agent_vectors(p)
-            self._draw_entity_core_ped(p, NEON_GREEN)
+            if draw_debug:
+                self._draw_pedestrian_perception(p)
+                self._draw_pedestrian_vector(p)
+            ped_blits.append((self._ped_sprite, (int(p.x) - r, int(p.y) - r)))
+            # Overlay reach: the 80px FOV arc box
+            dirty.append(pygame.Rect(int(p.x) - 42, int(p.y) - 42, 84, 84))
+        
+        if draw_debug:
+            self._debug_layer.fblits(overlay_blits)
+            # Erase overlays left by the previous refresh, then remember this one's footprint
+            footprint = dirty[:]
+            dirty.extend(self._overlay_rects)
+            self._overlay_rects = footprint
+            # Unmerged: bounding unions of dense clusters cover more than the overlaps they save
+            layer, bounds = self._debug_layer, self.screen.get_rect()
+            self._overlay_blits = [(layer, r, r) for r in (f.clip(bounds) for f in footprint) if r]
+        # Only the footprint can hold overlay pixels; the rest of the layer is colorkey
+        if self._overlay_blits:
+            self.screen.blits(self._overlay_blits, doreturn=False)
+        self.screen.fblits(car_blits)
+        self.screen.fblits(ped_blits)
 
         self._draw_traffic_lights(sim.traffic_light)
         self._draw_hud(sim)
         self._draw_emergency_button(sim)
         self._handle_inspector(sim)
+        
+        # Present only what changed, as disjoint merged rects; fall back to a full
+        # flip on the first frame, after an expose, or when the merged area is large
+        self.dirty_rects = self._merge_rects(self._prev_dirty + dirty, self.screen.get_rect())
+        self.full_frame = self._full_redraw or sum(r.w * r.h for r in self.dirty_rects) > self._flip_area
+        if self.full_frame:
+            self.dirty_rects = [self.screen.get_rect()]
+            self._full_redraw = False
+        self._prev_dirty = dirty
+
+    @staticmethod
+    def _merge_rects(rects: List[pygame.Rect], bounds: pygame.Rect) -> List[pygame.Rect]:
+        """Clips rects to `bounds` and unions every cluster of overlapping ones into its bounding rect."""
+        merged: List[pygame.Rect] = []
+        for r in rects:
+            r = r.clip(bounds)
+            if not r: continue
+            # A union can reach rects it did not touch before: repeat until it is disjoint
+            hits = r.collidelistall(merged)
+            while hits:
+                r.unionall_ip([merged[i] for i in hits])
+                for i in reversed(hits): del merged[i]
+                hits = r.collidelistall(merged)
+            merged.append(r)
+        return merged
 
     def _draw_emergency_button(self, sim):
         """Renders the manual emergency spawn button."""
@@ -70,170 +242,214 @@ class VisualizationManager:
         
         # Glow when active emergency vehicle on screen
         if is_active:
-            for i in range(1, 4):
-                pygame.draw.rect(self.screen, (*NEON_RED, 30 // i), (bx-i*2, by-i*2, bw+i*4, bh+i*4), border_radius=8)
+            self.screen.blit(self._btn_glow, (bx - 6, by - 6))
         
         pygame.draw.rect(self.screen, (10, 10, 30), EMERGENCY_BUTTON_RECT, border_radius=8)
         pygame.draw.rect(self.screen, color, EMERGENCY_BUTTON_RECT, 2, border_radius=8)
+        self._dirty.append(pygame.Rect(EMERGENCY_BUTTON_RECT).inflate(12, 12))
         
         text = "SPAWN AMBULANCE"
-        txt_surf = self.font_hud.render(text, True, color)
+        txt_surf = self._text(self.font_hud, text, color)
         self.screen.blit(txt_surf, txt_surf.get_rect(center=(bx + bw//2, by + bh//2)))
 
-    def _draw_infrastructure(self):
+    def _build_button_glow(self) -> None:
+        """Three fading outlines around the emergency button, pre-blended into one sprite."""
+        _, _, bw, bh = EMERGENCY_BUTTON_RECT
+        self._btn_glow = pygame.Surface((bw + 12, bh + 12), pygame.SRCALPHA)
+        self._btn_glow.fill((*NEON_RED, 0))
+        for i in range(1, 4):
+            layer = pygame.Surface((bw + i*4, bh + i*4), pygame.SRCALPHA)
+            pygame.draw.rect(layer, (*NEON_RED, 30 // i), layer.get_rect(), border_radius=8)
+            self._btn_glow.blit(layer, (6 - i*2, 6 - i*2))
+
+    def _build_bulb_sprites(self) -> None:
+        """Lit bulb per signal color: three fading glow rings plus the core, pre-blended."""
+        self._bulb_sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        for color, _ in _TL_BULBS:
+            sprite = pygame.Surface((24, 24), pygame.SRCALPHA)
+            sprite.fill((*color, 0))
+            for r in range(1, 4):
+                layer = pygame.Surface((24, 24), pygame.SRCALPHA)
+                pygame.draw.circle(layer, (*color, 60 // r), (12, 12), 6 + r*2)
+                sprite.blit(layer, (0, 0))
+            pygame.draw.circle(sprite, color, (12, 12), 6)
+            self._bulb_sprites[color] = sprite
+
+    def _build_fov_sprites(self) -> None:
+        """Pedestrian FOV arc + comfort zone per alert color and heading step (colorkeyed like the debug layer)."""
+        fov_angle = 90
+        self._fov_sprites: Dict[Tuple[int, int, int], List[pygame.Surface]] = {}
+        for color, cz_color in ((NEON_GREEN, NEON_CYAN), (NEON_ORANGE, NEON_RED)):
+            sprites = self._fov_sprites[color] = []
+            for dir_angle in range(0, 360, FOV_STEP):
+                sprite = pygame.Surface((80, 80)).convert()
+                sprite.set_colorkey(DEBUG_KEY)
+                sprite.fill(DEBUG_KEY)
+                start_rad = math.radians(dir_angle - fov_angle/2)
+                end_rad = math.radians(dir_angle + fov_angle/2)
+                pygame.draw.arc(sprite, color, sprite.get_rect(), start_rad, end_rad, 2)
+                pygame.draw.circle(sprite, cz_color, (40, 40), 25, 1)
+                sprites.append(sprite)
+
+    def _build_overlay_sprites(self) -> None:
+        """Path dots (moving / stopped) and per-heading car vectors, colorkeyed like the debug layer."""
+        def keyed(w, h):
+            surf = pygame.Surface((w, h)).convert()
+            surf.set_colorkey(DEBUG_KEY)
+            surf.fill(DEBUG_KEY)
+            return surf
+        
+        self._path_dots = []
+        for color in (NEON_CYAN, NEON_ORANGE):
+            dot = keyed(5, 5)
+            pygame.draw.circle(dot, color, (2, 2), 2)
+            self._path_dots.append(dot)
+        
+        self._vector_sprites: Dict[Tuple[int, int], pygame.Surface] = {}
+        for d in (NORTH_DIR, SOUTH_DIR, EAST_DIR, WEST_DIR):
+            vec = self._vector_sprites[d] = keyed(60, 60)
+            pygame.draw.line(vec, NEON_GREEN, (30, 30), (30 + d[0] * 25, 30 + d[1] * 25), 2)
+
+    def _build_crosswalk_strips(self) -> None:
+        """Pre-renders one horizontal and one vertical zebra strip (transparent gaps)."""
+        stripe_color = (60, 60, 100)
+        stripe_w = 4
+        self._cw_h = pygame.Surface((ROAD_WIDTH, CW_WIDTH), pygame.SRCALPHA)
+        self._cw_v = pygame.Surface((CW_WIDTH, ROAD_WIDTH), pygame.SRCALPHA)
+        for i in range(5, ROAD_WIDTH, 15):
+            pygame.draw.rect(self._cw_h, stripe_color, (i, 0, stripe_w, CW_WIDTH))
+            pygame.draw.rect(self._cw_v, stripe_color, (0, i, CW_WIDTH, stripe_w))
+
+    def _build_background(self, surface: pygame.Surface) -> None:
+        """Rasterizes the static scene (backdrop, asphalt, crosswalks, markings) once."""
+        surface.fill(DEEP_SPACE)
         cx, cy = INTERSECTION_CENTER, INTERSECTION_CENTER
         rw = ROAD_WIDTH // 2
+        sn, ss, se, sw = STOP_LINES["N"], STOP_LINES["S"], STOP_LINES["E"], STOP_LINES["W"]
+        cwo, cww = CW_OFFSET, CW_WIDTH
         
         # Asphalt
-        pygame.draw.rect(self.screen, ASPHALT_NIGHT, (cx - rw, 0, ROAD_WIDTH, HEIGHT))
-        pygame.draw.rect(self.screen, ASPHALT_NIGHT, (0, cy - rw, WIDTH, ROAD_WIDTH))
+        pygame.draw.rect(surface, ASPHALT_NIGHT, (cx - rw, 0, ROAD_WIDTH, HEIGHT))
+        pygame.draw.rect(surface, ASPHALT_NIGHT, (0, cy - rw, WIDTH, ROAD_WIDTH))
         
         # Draw Crosswalks (Neon Zebra Stripes)
-        stripe_color = (60, 60, 100)
-        stripe_w = 4
-        
         # North
-        cw_n_y = STOP_LINES["N"] - CW_OFFSET
-        for i in range(cx - rw + 5, cx + rw, 15):
-            pygame.draw.rect(self.screen, stripe_color, (i, cw_n_y, stripe_w, CW_WIDTH))
-        pygame.draw.rect(self.screen, NEON_CYAN, (cx - rw, cw_n_y, ROAD_WIDTH, CW_WIDTH), 1)
+        cw_n_y = sn - cwo
+        surface.blit(self._cw_h, (cx - rw, cw_n_y))
+        pygame.draw.rect(surface, NEON_CYAN, (cx - rw, cw_n_y, ROAD_WIDTH, cww), 1)
         
         # South
-        cw_s_y = STOP_LINES["S"] + CW_OFFSET - CW_WIDTH
-        for i in range(cx - rw + 5, cx + rw, 15):
-            pygame.draw.rect(self.screen, stripe_color, (i, cw_s_y, stripe_w, CW_WIDTH))
-        pygame.draw.rect(self.screen, NEON_CYAN, (cx - rw, cw_s_y, ROAD_WIDTH, CW_WIDTH), 1)
+        cw_s_y = ss + cwo - cww
+        surface.blit(self._cw_h, (cx - rw, cw_s_y))
+        pygame.draw.rect(surface, NEON_CYAN, (cx - rw, cw_s_y, ROAD_WIDTH, cww), 1)
         
         # West
-        cw_w_x = STOP_LINES["W"] - CW_OFFSET
-        for i in range(cy - rw + 5, cy + rw, 15):
-            pygame.draw.rect(self.screen, stripe_color, (cw_w_x, i, CW_WIDTH, stripe_w))
-        pygame.draw.rect(self.screen, NEON_CYAN, (cw_w_x, cy - rw, CW_WIDTH, ROAD_WIDTH), 1)
+        cw_w_x = sw - cwo
+        surface.blit(self._cw_v, (cw_w_x, cy - rw))
+        pygame.draw.rect(surface, NEON_CYAN, (cw_w_x, cy - rw, cww, ROAD_WIDTH), 1)
         
         # East
-        cw_e_x = STOP_LINES["E"] + CW_OFFSET - CW_WIDTH
-        for i in range(cy - rw + 5, cy + rw, 15):
-            pygame.draw.rect(self.screen, stripe_color, (cw_e_x, i, CW_WIDTH, stripe_w))
-        pygame.draw.rect(self.screen, NEON_CYAN, (cw_e_x, cy - rw, CW_WIDTH, ROAD_WIDTH), 1)
+        cw_e_x = se + cwo - cww
+        surface.blit(self._cw_v, (cw_e_x, cy - rw))
+        pygame.draw.rect(surface, NEON_CYAN, (cw_e_x, cy - rw, cww, ROAD_WIDTH), 1)
 
         # Neon Markings
         line_color = (60, 60, 90)
-        pygame.draw.line(self.screen, line_color, (cx - rw, 0), (cx - rw, HEIGHT), 2)
-        pygame.draw.line(self.screen, line_color, (cx + rw, 0), (cx + rw, HEIGHT), 2)
-        pygame.draw.line(self.screen, line_color, (0, cy - rw), (WIDTH, cy - rw), 2)
-        pygame.draw.line(self.screen, line_color, (0, cy + rw), (WIDTH, cy + rw), 2)
+        pygame.draw.line(surface, line_color, (cx - rw, 0), (cx - rw, HEIGHT), 2)
+        pygame.draw.line(surface, line_color, (cx + rw, 0), (cx + rw, HEIGHT), 2)
+        pygame.draw.line(surface, line_color, (0, cy - rw), (WIDTH, cy - rw), 2)
+        pygame.draw.line(surface, line_color, (0, cy + rw), (WIDTH, cy + rw), 2)
 
-    def _draw_entity_core(self, agent, color):
-        # Body Glow
-        for i in range(3):
-            alpha = 100 // (i + 1)
-            surf = pygame.Surface((agent.rect.width + i*4, agent.rect.height + i*4), pygame.SRCALPHA)
-            pygame.draw.rect(surf, (*color, alpha), surf.get_rect(), border_radius=4)
-            self.screen.blit(surf, agent.rect.move(-i*2, -i*2))
+    def _build_entity_sprites(self) -> None:
+        """Pre-renders both car liveries in both orientations and the pedestrian disc."""
+        for w, h in ((40, 20), (20, 40)):
+            for color in (NEON_CYAN, NEON_RED):
+                self._get_car_sprite(w, h, color)
         
-        pygame.draw.rect(self.screen, color, agent.rect, border_radius=4)
-
-    def _draw_entity_core_ped(self, p, color):
         # Pedestrian is a circle in this view for cleaner look
-        pygame.draw.circle(self.screen, (*color, 60), (int(p.x), int(p.y)), p.radius + 4)
-        pygame.draw.circle(self.screen, color, (int(p.x), int(p.y)), p.radius)
+        r = PED_BODY_RADIUS + GLOW_PAD
+        self._ped_sprite = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self._ped_sprite, (*NEON_GREEN, 60), (r, r), r)
+        pygame.draw.circle(self._ped_sprite, NEON_GREEN, (r, r), PED_BODY_RADIUS)
+
+    def _get_car_sprite(self, w: int, h: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Glow sprite for a body of size (w, h), rendered once per (w, h, color)."""
+        key = (w, h, color)
+        sprite = self._glow_cache.get(key)
+        if sprite is None:
+            sprite = self._glow_cache[key] = self._render_car_sprite(w, h, color)
+        return sprite
 
-    def _draw_car_perception(self, car, peds, lights):
+    def _render_car_sprite(self, w: int, h: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Body plus three fading glow outlines, drawn at an offset of GLOW_PAD."""
+        sprite = pygame.Surface((w + GLOW_PAD * 2, h + GLOW_PAD * 2), pygame.SRCALPHA)
+        sprite.fill((*color, 0)) # Transparent but same hue, so blended layers keep the color
+        for i in range(3):
+            alpha = 100 // (i + 1)
+            layer = pygame.Surface((w + i*4, h + i*4), pygame.SRCALPHA)
+            pygame.draw.rect(layer, (*color, alpha), layer.get_rect(), border_radius=4)
+            sprite.blit(layer, (GLOW_PAD - i*2, GLOW_PAD - i*2))
+        pygame.draw.rect(sprite, color, (GLOW_PAD, GLOW_PAD, w, h), border_radius=4)
+        return sprite
+
+    def _draw_car_perception(self, car, lights):
         look_ahead = max(60, car.current_speed * 40)
-        rays = [(-15, 0.8), (0, 1.0), (15, 0.8)]
         
-        for angle, l_mult in rays:
-            length = look_ahead * l_mult
-            end_pos = self._get_ray_end(car, angle, length)
-            ray_color = (100, 100, 150, 100)
-            marker = None
-
-            # Logic Check
-            if car._is_light_red(lights):
-                ray_color, marker = (*NEON_CYAN, 200), "diamond"
-            
-            for p in peds:
-                dist = math.hypot(car.rect.centerx - p.x, car.rect.centery - p.y)
-                if dist < look_ahead:
-                    ray_color, marker = (*NEON_RED, 255), "triangle"
-            
-            pygame.draw.aaline(self.screen, ray_color[:3], car.rect.center, end_pos)
-            if marker: self._draw_ray_marker(end_pos, ray_color[:3], marker)
-
-        # Predictive Trajectory
-        self._draw_path(car, NEON_ORANGE if car.stopped else NEON_CYAN)
+        # Ray state is the same for all three rays: pick it once per car
+        ray_color, marker = (100, 100, 150, 100), None
+        if len(self._ped_xy):
+            # Any pedestrian inside the look-ahead radius (squared distances, no sqrt)
+            d = self._ped_xy - car.rect.center
+            if (np.einsum('ij,ij->i', d, d) < look_ahead * look_ahead).any():
+                ray_color, marker = (*NEON_RED, 255), "triangle"
+        if marker is None and car._is_light_red(lights):
+            ray_color, marker = (*NEON_CYAN, 200), "diamond"
+        
+        # All three rays as one fan polyline (end, center, end, center, end) with integer coords
+        center = car.rect.center
+        cx, cy = center
+        ends = [(int(cx + dx * look_ahead * l_mult), int(cy + dy * look_ahead * l_mult))
+                for dx, dy, l_mult in _RAY_OFFSETS[car.direction]]
+        pygame.draw.lines(self._debug_layer, ray_color[:3], False, [ends[0], center, ends[1], center, ends[2]])
+        if marker:
+            for end_pos in ends: self._draw_ray_marker(end_pos, ray_color[:3], marker)
 
-    def _draw_pedestrian_perception(self, p, cars):
-        fov_angle = 90
+    def _draw_pedestrian_perception(self, p):
         dir_angle = math.degrees(math.atan2(-p.dir_y, p.dir_x))
-        color = NEON_GREEN
-        
-        for car in cars:
-            if math.hypot(p.x - car.rect.centerx, p.y - car.rect.centery) < 80:
-                color = NEON_ORANGE
-                break
+        d = self._car_xy - (p.x, p.y)
+        color = NEON_ORANGE if (np.einsum('ij,ij->i', d, d) < 80 * 80).any() else NEON_GREEN
         
-        # Draw FOV Arc
-        rect = pygame.Rect(p.x - 40, p.y - 40, 80, 80)
-        start_rad = math.radians(dir_angle - fov_angle/2)
-        end_rad = math.radians(dir_angle + fov_angle/2)
-        pygame.draw.arc(self.screen, (*color, 100), rect, start_rad, end_rad, 2)
-
-        # Comfort Zone
-        cz_color = NEON_CYAN if color == NEON_GREEN else NEON_RED
-        pygame.draw.circle(self.screen, (*cz_color, 40), (int(p.x), int(p.y)), 25, 1)
-
-    def _draw_agent_vectors(self, agent):
-        if hasattr(agent, 'direction'): # Car
-            vx, vy = agent.direction[0] * 25, agent.direction[1] * 25
-            pygame.draw.line(self.screen, NEON_GREEN, agent.rect.center, 
-                             (agent.rect.centerx + vx, agent.rect.centery + vy), 2)
-        elif hasattr(agent, 'dir_x'): # Pedestrian
-            vx, vy = agent.dir_x * 15, agent.dir_y * 15
-            pygame.draw.line(self.screen, NEON_GREEN, (int(agent.x), int(agent.y)), 
-                             (int(agent.x + vx), int(agent.y + vy)), 2)
-
-    def _draw_path(self, agent, color):
-        points = []
+        # FOV Arc + Comfort Zone: one pre-rendered sprite for the nearest heading step
+        sprite = self._fov_sprites[color][round(dir_angle / FOV_STEP) % len(self._fov_sprites[color])]
+        self._debug_layer.blit(sprite, (int(p.x) - 40, int(p.y) - 40))
+
+    def _draw_pedestrian_vector(self, p):
+        # Free heading (not one of the 4 axes), so this stays a line draw
+        vx, vy = p.dir_x * 15, p.dir_y * 15
+        pygame.draw.line(self._debug_layer, NEON_GREEN, (int(p.x), int(p.y)), 
+                         (int(p.x + vx), int(p.y + vy)), 2)
+
+    def _queue_car_overlays(self, car, blits):
+        """Appends the car's predictive path dots and heading vector to a shared blit batch."""
+        cx, cy = car.rect.center
+        dx, dy = car.direction
+        dot = self._path_dots[car.stopped] # Orange while stopped, cyan while moving
         for i in range(1, 6):
             step = i * 25
-            if hasattr(agent, 'direction'):
-                px = agent.rect.centerx + agent.direction[0] * step
-                py = agent.rect.centery + agent.direction[1] * step
-            else:
-                px = agent.x + agent.dir_x * step
-                py = agent.y + agent.dir_y * step
-            points.append((px, py))
-        
-        for p in points:
-            pygame.draw.circle(self.screen, color, (int(p[0]), int(p[1])), 2)
+            blits.append((dot, (int(cx + dx * step) - 2, int(cy + dy * step) - 2)))
+        blits.append((self._vector_sprites[car.direction], (cx - 30, cy - 30)))
 
     def _draw_ray_marker(self, pos, color, type):
         if type == "diamond":
             pts = [(pos[0], pos[1]-5), (pos[0]+5, pos[1]), (pos[0], pos[1]+5), (pos[0]-5, pos[1])]
-            pygame.draw.polygon(self.screen, color, pts)
+            pygame.draw.polygon(self._debug_layer, color, pts)
         elif type == "triangle":
             pts = [(pos[0], pos[1]-6), (pos[0]+5, pos[1]+4), (pos[0]-5, pos[1]+4)]
-            pygame.draw.polygon(self.screen, color, pts)
-
-    def _get_ray_end(self, car, angle_offset, length):
-        base_angle = math.atan2(car.direction[1], car.direction[0])
-        total_angle = base_angle + math.radians(angle_offset)
-        return (car.rect.centerx + math.cos(total_angle) * length, 
-                car.rect.centery + math.sin(total_angle) * length)
+            pygame.draw.polygon(self._debug_layer, color, pts)
 
     def _draw_traffic_lights(self, tl):
-        cx, rw = INTERSECTION_CENTER, ROAD_WIDTH // 2
-        # Defined positions and orientations for the 4 traffic lights
-        # (x, y, axis, horizontal_flag)
-        configs = [
-            (cx - rw - 25, cx - rw - 75, "NS", False), # North-West corner (facing North)
-            (cx + rw + 5, cx + rw + 15, "NS", False),  # South-East corner (facing South)
-            (cx - rw - 75, cx + rw + 5, "EW", True),   # South-West corner (facing West)
-            (cx + rw + 15, cx - rw - 25, "EW", True)   # North-East corner (facing East)
-        ]
-        
-        for x, y, axis, is_horiz in configs:
+        self._dirty.extend(_TL_DIRTY)
+        for x, y, axis, is_horiz in _TL_CONFIGS:
             # Draw Housing
             w, h = (60, 20) if is_horiz else (20, 60)
             pygame.draw.rect(self.screen, (20, 20, 40), (x, y, w, h), border_radius=5)
@@ -242,13 +458,9 @@ class VisualizationManager:
             # Determine which bulb is active
             active_color = tl.get_color_state(axis)
             
-            # Define bulbs (Red, Yellow, Green)
-            bulbs = [COLOR_RED_ON, COLOR_YELLOW_ON, COLOR_GREEN_ON]
-            off_colors = [(80, 0, 0), (80, 60, 0), (0, 80, 0)]
-            
-            for i, bulb_color in enumerate(bulbs):
+            for i, (bulb_color, off_color) in enumerate(_TL_BULBS):
                 is_active = (bulb_color == active_color)
-                draw_color = bulb_color if is_active else off_colors[i]
+                draw_color = bulb_color if is_active else off_color
                 
                 # Bulb Position
                 if is_horiz:
@@ -256,12 +468,11 @@ class VisualizationManager:
                 else:
                     bx, by = x + 10, y + 10 + i*20
                 
-                # Render Glow for active bulb
+                # Active bulb is one glow sprite; unlit ones are a plain disc
                 if is_active:
-                    for r in range(1, 4):
-                        pygame.draw.circle(self.screen, (*draw_color, 60 // r), (bx, by), 6 + r*2)
-                
-                pygame.draw.circle(self.screen, draw_color, (bx, by), 6)
+                    self.screen.blit(self._bulb_sprites[draw_color], (bx - 12, by - 12))
+                else:
+                    pygame.draw.circle(self.screen, draw_color, (bx, by), 6)
 
     def _draw_hud(self, sim):
         # Stats Panels
@@ -271,51 +482,74 @@ class VisualizationManager:
         # Left HUD: System Info & AI Settings
         stats = [
             (f"AI_TRAFFIC_OS_v2.5", NEON_CYAN),
-            (f"FPS: {int(sim.clock.get_fps())}", NEON_GREEN),
+            ("FPS: ", NEON_GREEN, f"{int(sim.clock.get_fps())}"),
             (f"AI_EPSILON: {sim.agent.epsilon:.3f}", NEON_ORANGE),
             (f"AI_LR:      {sim.agent.learning_rate:.5f}", NEON_ORANGE),
             (f"AI_GAMMA:   {sim.agent.gamma:.2f}", NEON_ORANGE),
             (f"AGENTS: C:{len(sim.cars):02} P:{len(sim.pedestrians):02}", NEON_CYAN)
         ]
-        for i, (txt, col) in enumerate(stats):
-            self.screen.blit(self.font_hud.render(txt, True, col), (20, 20 + i*22))
+        self._blit_text_block(self.font_hud, stats, 20, 20, 22)
 
-        # Right HUD: Traffic Metrics
+        # Right HUD: Traffic Metrics (live values are composed from glyph sprites)
         flow = sum(1 for c in sim.cars if not c.stopped) / max(1, len(sim.cars)) * 100
         r_stats = [
-            (f"REALTIME_FLOW: {flow:.1f}%", NEON_ORANGE),
-            (f"LIFETIME_FLOW: {sim.lifetime_flow:.1f}%", NEON_GREEN),
-            (f"AVG_VELOCITY:  {sum(c.current_speed for c in sim.cars) / max(1, len(sim.cars)):.2f}u", NEON_CYAN),
+            ("REALTIME_FLOW: ", NEON_ORANGE, f"{flow:.1f}%"),
+            ("LIFETIME_FLOW: ", NEON_GREEN, f"{sim.lifetime_flow:.1f}%"),
+            ("AVG_VELOCITY:  ", NEON_CYAN, f"{sum(c.current_speed for c in sim.cars) / max(1, len(sim.cars)):.2f}u"),
             (f"INCIDENTS:     {self.collision_count}", NEON_RED),
-            (f"SIM_TIME:      {time.strftime('%M:%S', time.gmtime(time.time() - self.start_time))}", NEON_FUCHSIA)
+            ("SIM_TIME:      ", NEON_FUCHSIA, time.strftime('%M:%S', time.gmtime(time.time() - self.start_time)))
         ]
-        for i, (txt, col) in enumerate(r_stats):
-            self.screen.blit(self.font_hud.render(txt, True, col), (WIDTH - 300, 20 + i*22))
+        self._blit_text_block(self.font_hud, r_stats, WIDTH - 300, 20, 22)
 
         # Event Log
-        for i, log in enumerate(self.event_log):
-            self.screen.blit(self.font_main.render(log, True, (180, 180, 220)), (10, HEIGHT - 180 + i*20))
+        log_color = (180, 180, 220)
+        self._blit_text_block(self.font_main, [(log, log_color) for log in self.event_log], 10, HEIGHT - 180, 20)
+
+    def _blit_text_block(self, font, lines, x, y, step):
+        """
+        Blits a column of (text, color) lines in one fblits call and marks its bounds dirty.
+        A (label, color, value) line composes its per-frame value from glyph sprites
+        into the same call.
+        """
+        if not lines: return
+        seq, width = [], 0
+        for i, (txt, col, *value) in enumerate(lines):
+            surf = self._text(font, txt, col)
+            seq.append((surf, (x, y + i*step)))
+            end = x + surf.get_width()
+            if value:
+                end = self._compose_number(font, value[0], (end, y + i*step), col, seq)
+            width = max(width, end - x)
+        self.screen.fblits(seq)
+        self._dirty.append(pygame.Rect(x, y, width, (len(lines) - 1) * step + surf.get_height()))
 
     def _draw_panel(self, x, y, w, h):
-        surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        surf.fill((0, 0, 0, 160))
-        pygame.draw.rect(surf, NEON_CYAN, surf.get_rect(), 1)
-        self.screen.blit(surf, (x, y))
+        surf = self._panel_cache.get((w, h))
+        if surf is None:
+            surf = self._panel_cache[(w, h)] = pygame.Surface((w, h), pygame.SRCALPHA)
+            surf.fill((0, 0, 0, 160))
+            pygame.draw.rect(surf, NEON_CYAN, surf.get_rect(), 1)
+        self._dirty.append(self.screen.blit(surf, (x, y)))
 
     def _handle_inspector(self, sim):
         m_pos = pygame.mouse.get_pos()
-        self.hovered_agent = None
-        for a in sim.cars + sim.pedestrians:
-            if a.rect.collidepoint(m_pos):
-                self.hovered_agent = a; break
+        
+        # Cars take priority: a linear scan beats building a grid for a handful of them.
+        # Pedestrians reuse the simulation's grid, so only those around the cursor are tested.
+        self.hovered_agent = next((c for c in sim.cars if c.rect.collidepoint(m_pos)), None)
+        if not self.hovered_agent:
+            self._mouse_rect.topleft = m_pos
+            for p in sim.ped_grid.query_rect(self._mouse_rect, margin=PED_BODY_RADIUS):
+                if p.rect.collidepoint(m_pos):
+                    self.hovered_agent = p; break
         
         if self.hovered_agent:
             a = self.hovered_agent
             p_type = "CAR" if hasattr(a, 'current_speed') else "NPC"
             
-            # Popup
-            popup = pygame.Surface((200, 100), pygame.SRCALPHA); popup.fill((10, 10, 30, 230))
-            pygame.draw.rect(popup, NEON_CYAN, popup.get_rect(), 1)
+            # Popup (cached backdrop; text goes straight to the screen on top of it)
+            px, py = m_pos[0] + 15, m_pos[1] + 15
+            self._dirty.append(self.screen.blit(self._popup_bg, (px, py)))
             
             info = [
                 f"ID: {p_type}_{id(a)%9999}",
@@ -324,5 +558,4 @@ class VisualizationManager:
                 f"POS: {int(a.x)}, {int(a.y)}"
             ]
             for i, txt in enumerate(info):
-                popup.blit(self.font_main.render(txt, True, NEON_CYAN), (10, 10 + i*20))
-            self.screen.blit(popup, (m_pos[0]+15, m_pos[1]+15))
+                self.screen.blit(self._text(self.font_main, txt, NEON_CYAN), (px + 10, py + 10 + i*20))